@@ -1,4 +1,4 @@
-from flask import Flask
+from flask import Flask, make_response
 import os
 from flask_restx import Api
 from flask_sqlalchemy import SQLAlchemy
@@ -6,16 +6,23 @@ from flask_bcrypt import Bcrypt
 from flask_jwt_extended import JWTManager
 from config import config
 
-from app.api.v1.users import api as users_ns
-from app.api.v1.places import api as places_ns
-from app.api.v1.amenities import api as amenities_ns
-from app.api.v1.reviews import api as reviews_ns
-from app.api.v1.auth import api as auth_ns
+try:
+    import orjson
+except ImportError:  # optional: keep flask-restx's stdlib json output
+    orjson = None
 
+# Extensions are created before the namespaces are imported: the models
+# they pull in define their columns against `db` at import time.
 db = SQLAlchemy()
 bcrypt = Bcrypt()
 jwt = JWTManager()
 
+from app.api.v1.users import api as users_ns  # noqa: E402
+from app.api.v1.places import api as places_ns  # noqa: E402
+from app.api.v1.amenities import api as amenities_ns  # noqa: E402
+from app.api.v1.reviews import api as reviews_ns  # noqa: E402
+from app.api.v1.auth import api as auth_ns  # noqa: E402
+
 
 def create_app(config_name: str = 'development'):
     app = Flask(__name__)
@@ -29,6 +36,14 @@ def create_app(config_name: str = 'development'):
 
     api = Api(app, version='1.0', title='HBnB API', description='HBnB Application API')
 
+    if orjson is not None:
+        @api.representation('application/json')
+        def output_json(data, code, headers=None):
+            """Encode API responses with orjson (already bytes) instead of stdlib json."""
+            resp = make_response(orjson.dumps(data), code)
+            resp.headers.extend(headers or {})
+            return resp
+
     api.add_namespace(auth_ns, path='/api/v1/auth')
     api.add_namespace(users_ns, path='/api/v1/users')
     api.add_namespace(places_ns, path='/api/v1/places')
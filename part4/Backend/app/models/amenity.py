@@ -1,26 +1,30 @@
-from .base import BaseModel
+from sqlalchemy.orm import validates
+
+from app import db
+from app.models.base_model import BaseModel
+
 
 class Amenity(BaseModel):
     """Represents an amenity (feature) available in a Place."""
+    __tablename__ = 'amenities'
+
+    name = db.Column(db.String(50), nullable=False)
+
+    places = db.relationship('Place', secondary='place_amenity', back_populates='amenities')
 
     def __init__(self, name):
         """Initialize a new Amenity instance."""
         super().__init__()
         self.name = name
 
-    @property
-    def name(self):
-        """Get the amenity name."""
-        return self._name
-
-    @name.setter
-    def name(self, value):
-        """Set the amenity name with validation."""
+    @validates('name')
+    def validate_name(self, key, value):
+        """Validate the amenity name."""
         if not isinstance(value, str) or not value.strip():
             raise ValueError("Amenity name is required")
         if len(value) > 50:
             raise ValueError("Amenity name must be less than 50 characters")
-        self._name = value.strip()
+        return value.strip()
 
     def to_dict(self):
         """Serialize the amenity into a dictionary."""
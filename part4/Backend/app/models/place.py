@@ -7,91 +7,11 @@ def _get_db():
     return db
 
 # Association table for Place-Amenity many-to-many relationship
-place_amenity = db.Table('place_amenity',
+place_amenity = _get_db().Table('place_amenity',
     _get_db().Column('place_id', _get_db().String(60), _get_db().ForeignKey('places.id'), primary_key=True),
     _get_db().Column('amenity_id', _get_db().String(60), _get_db().ForeignKey('amenities.id'), primary_key=True)
 )
 
-class User(BaseModel):
-    """Represents a user in the HolbertonBnB application."""
-
-    __tablename__ = 'users'
-
-    # ----------------- Columns ----------------- #
-    first_name = _get_db().Column(_get_db().String(50), nullable=False)
-    last_name = _get_db().Column(_get_db().String(50), nullable=False)
-    email = _get_db().Column(_get_db().String(120), nullable=False, unique=True)
-    password = _get_db().Column(_get_db().String(128), nullable=False)
-    is_admin = _get_db().Column(_get_db().Boolean, default=False)
-
-    # ----------------- Relationships ----------------- #
-    places = _get_db().relationship('Place', backref='owner', lazy=True)
-    reviews = _get_db().relationship('Review', backref='user', lazy=True)
-
-    # ----------------- Initialization ----------------- #
-    def __init__(self, first_name, last_name, email, is_admin=False):
-        super().__init__()
-        self.first_name = first_name
-        self.last_name = last_name
-        self.email = email
-        self.is_admin = bool(is_admin)
-
-    # ----------------- Password Methods ----------------- #
-    def hash_password(self, password):
-        """Hash the password for secure storage."""
-        self.password = bcrypt.generate_password_hash(password).decode('utf-8')
-
-    def verify_password(self, password):
-        """Verify the hashed password."""
-        return bcrypt.check_password_hash(self.password, password)
-
-    # ----------------- Property Validation ----------------- #
-    @property
-    def first_name(self):
-        return self._first_name
-
-    @first_name.setter
-    def first_name(self, value):
-        value = (value or "").strip()
-        if not (1 <= len(value) <= 50):
-            raise ValueError("First name must be 1-50 characters long")
-        self._first_name = value
-
-    @property
-    def last_name(self):
-        return self._last_name
-
-    @last_name.setter
-    def last_name(self, value):
-        value = (value or "").strip()
-        if not (1 <= len(value) <= 50):
-            raise ValueError("Last name must be 1-50 characters long")
-        self._last_name = value
-
-    @property
-    def email(self):
-        return self._email
-
-    @email.setter
-    def email(self, value):
-        value = (value or "").strip().lower()
-        if "@" not in value or "." not in value or " " in value:
-            raise ValueError("Invalid email format")
-        self._email = value
-
-    # ----------------- Serialization ----------------- #
-    def to_dict(self):
-        """Return dictionary representation of the user."""
-        return {
-            "id": self.id,
-            "first_name": self.first_name,
-            "last_name": self.last_name,
-            "email": self.email,
-            "is_admin": self.is_admin,
-            "places": [place.id for place in self.places],
-            "reviews": [review.id for review in self.reviews],
-        }
-
 class Place(BaseModel):
     """Represents a place in the HolbertonBnB application."""
 
@@ -99,7 +19,7 @@ class Place(BaseModel):
 
     # ----------------- Columns ----------------- #
     title = _get_db().Column(_get_db().String(100), nullable=False)
-    description = _get_db().Column(db.Text, nullable=True)
+    description = _get_db().Column(_get_db().Text, nullable=True)
     price = _get_db().Column(_get_db().Float, nullable=False)
     latitude = _get_db().Column(_get_db().Float, nullable=True)
     longitude = _get_db().Column(_get_db().Float, nullable=True)
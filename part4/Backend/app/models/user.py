@@ -1,40 +1,60 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy.orm import validates
+
+from app import db, bcrypt
 from app.models.base_model import BaseModel
 
+# Recent bcrypt check results, see User.verify_password
+_VERIFY_CACHE_TTL = 60
+_VERIFY_CACHE_SIZE = 1024
+_VERIFY_CACHE_KEY = os.urandom(32)
+_verify_cache = OrderedDict()
+_verify_lock = threading.Lock()
+
+
+def _forget_verifications(password_hash):
+    """Drop cached checks made against a hash that is being replaced."""
+    with _verify_lock:
+        for key in [k for k in _verify_cache if k[0] == password_hash]:
+            del _verify_cache[key]
+
+
 class User(BaseModel):
-    """User model with deferred column definitions."""
+    """User model."""
     __tablename__ = 'users'
-    
-    def __init_subclass__(cls, **kwargs):
-        """Set up SQLAlchemy columns when the class is first used."""
-        super().__init_subclass__(**kwargs)
-        
-    def __new__(cls, *args, **kwargs):
-        # Set up columns on first instantiation if not already done
-        if not hasattr(cls, '_columns_initialized'):
-            cls._setup_columns()
-            cls._columns_initialized = True
-        return super().__new__(cls, *args, **kwargs)
-    
-    @classmethod
-    def _setup_columns(cls):
-        """Set up SQLAlchemy columns with late import."""
-        from app import db, bcrypt
-        
-        # Define columns
-        cls.first_name = db.Column(db.String(50), nullable=False)
-        cls.last_name = db.Column(db.String(50), nullable=False) 
-        cls.email = db.Column(db.String(120), unique=True, nullable=False)
-        cls.password = db.Column(db.String(128), nullable=False)
-        cls.is_admin = db.Column(db.Boolean, default=False)
-        
-        # Store bcrypt reference for instance methods
-        cls._bcrypt = bcrypt
-    
+
+    first_name = db.Column(db.String(50), nullable=False)
+    last_name = db.Column(db.String(50), nullable=False)
+    email = db.Column(db.String(120), unique=True, nullable=False, index=True)
+    password = db.Column(db.String(128), nullable=False)
+    is_admin = db.Column(db.Boolean, default=False)
+
+    places = db.relationship('Place', backref='owner', lazy=True)
+    reviews = db.relationship('Review', backref='user', lazy=True)
+
+    # bcrypt reference for instance methods
+    _bcrypt = bcrypt
+
+    # Serialized fields, fixed once instead of walking __dict__ on every to_dict()
+    _DICT_FIELDS = ('id', 'first_name', 'last_name', 'email', 'is_admin')
+
+    @validates('email')
+    def normalize_email(self, key, value):
+        """Store emails lowercased, however they are set, so lookups are a plain equality on the index."""
+        return value.strip().lower() if value else value
+
     def hash_password(self, password):
         """Hash the password using available bcrypt implementation.
 
         Supports both Flask-Bcrypt (generate_password_hash) and raw bcrypt (hashpw).
         """
+        if self.password:
+            _forget_verifications(self.password)
         if hasattr(self._bcrypt, 'generate_password_hash'):
             # Flask-Bcrypt
             self.password = self._bcrypt.generate_password_hash(password).decode('utf-8')
@@ -46,21 +66,37 @@ class User(BaseModel):
         """Verify the password using available bcrypt implementation.
 
         Supports both Flask-Bcrypt (check_password_hash) and raw bcrypt (checkpw).
+        Results are cached briefly per (hash, keyed password digest) to skip bcrypt on repeat logins.
         """
         if not self.password:
             return False
+        key = (self.password, hashlib.blake2b(password.encode('utf-8'), key=_VERIFY_CACHE_KEY, digest_size=16).digest())
+        now = time.monotonic()
+        with _verify_lock:
+            cached = _verify_cache.get(key)
+            if cached is not None and cached[0] > now:
+                _verify_cache.move_to_end(key)
+                return cached[1]
+
         if hasattr(self._bcrypt, 'check_password_hash'):
-            return self._bcrypt.check_password_hash(self.password, password)
+            result = self._bcrypt.check_password_hash(self.password, password)
         else:
-            return self._bcrypt.checkpw(password.encode('utf-8'), self.password.encode('utf-8'))
+            result = self._bcrypt.checkpw(password.encode('utf-8'), self.password.encode('utf-8'))
+
+        with _verify_lock:
+            _verify_cache[key] = (now + _VERIFY_CACHE_TTL, result)
+            _verify_cache.move_to_end(key)
+            while len(_verify_cache) > _VERIFY_CACHE_SIZE:
+                _verify_cache.popitem(last=False)
+        return result
 
     # Backwards-compatible alias expected by some modules
     def check_password(self, password):
         return self.verify_password(password)
     
     def to_dict(self):
-        """Return a dictionary representation of the user."""
-        result = super().to_dict()
-        # Remove password from dictionary for security
-        result.pop('password', None)
+        """Return a dictionary representation of the user (the password is never included)."""
+        result = {field: getattr(self, field) for field in self._DICT_FIELDS}
+        result['created_at'] = self.created_at.isoformat() if self.created_at else None
+        result['updated_at'] = self.updated_at.isoformat() if self.updated_at else None
         return result
@@ -98,7 +98,7 @@ class SQLAlchemyRepository(Repository):
         self.db.session.commit()
 
     def get(self, obj_id: str) -> Optional[Any]:
-        return self.model.query.get(obj_id)
+        return self.db.session.get(self.model, obj_id)
 
     def get_all(self) -> List[Any]:
         return self.model.query.all()
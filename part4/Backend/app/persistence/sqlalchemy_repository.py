@@ -14,7 +14,7 @@ class SQLAlchemyRepository(Repository):
 
     def get(self, obj_id):
         """Retrieve an object by its ID."""
-        return self.model.query.get(obj_id)
+        return db.session.get(self.model, obj_id)
 
     def get_all(self):
         """Retrieve all objects of this model."""
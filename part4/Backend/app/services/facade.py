@@ -34,6 +34,7 @@ class HBnBFacade:
         return self.user_repo.get(user_id)
 
     def get_user_by_email(self, email: str):
+        email = (email or "").strip().lower()
         return self.user_repo.model.query.filter_by(email=email).first()
 
 
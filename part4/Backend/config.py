@@ -5,6 +5,7 @@ class Config:
     DEBUG = False
     TESTING = False
     SQLALCHEMY_TRACK_MODIFICATIONS = False  # sans effet si tu n'utilises pas SQLAlchemy
+    MAX_CONTENT_LENGTH = 64 * 1024  # rejette les corps de requête trop gros (413)
 
 class DevelopmentConfig(Config):
     DEBUG = True
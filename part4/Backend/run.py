@@ -1,3 +1,5 @@
+import os
+
 from app import create_app, db
 
 app = create_app()
@@ -5,4 +7,4 @@ app = create_app()
 if __name__ == "__main__":
     with app.app_context():
         db.create_all()
-    app.run(debug=True)
+    app.run(debug=os.getenv('FLASK_DEBUG') == '1', threaded=True)
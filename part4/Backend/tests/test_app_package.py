@@ -0,0 +1,81 @@
+"""Tests for the flask-restx application package (app/)."""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app, db  # noqa: E402
+
+
+class TestUserEndpoints(unittest.TestCase):
+    """Tests for the User and Auth endpoints of the app package."""
+
+    def setUp(self):
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def test_register_and_login(self):
+        resp = self.client.post('/api/v1/users/', json={
+            "first_name": "Alice",
+            "last_name": "Smith",
+            "email": " Alice@Example.com ",
+            "password": "secret123"
+        })
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(resp.json["email"], "alice@example.com")
+        self.assertNotIn("password", resp.json)
+        self.assertIsNotNone(resp.json["created_at"])
+
+        resp = self.client.post('/api/v1/auth/login', json={
+            "email": "ALICE@example.com",
+            "password": "secret123"
+        })
+        self.assertEqual(resp.status_code, 200)
+        self.assertIn("access_token", resp.json)
+
+        # the cached successful check must not leak to another password
+        resp = self.client.post('/api/v1/auth/login', json={
+            "email": "alice@example.com",
+            "password": "wrong"
+        })
+        self.assertEqual(resp.status_code, 401)
+
+    def test_duplicate_email(self):
+        payload = {
+            "first_name": "Bob",
+            "last_name": "Brown",
+            "email": "bob@example.com",
+            "password": "secret123"
+        }
+        self.assertEqual(self.client.post('/api/v1/users/', json=payload).status_code, 201)
+        payload["email"] = "BOB@example.com"
+        resp = self.client.post('/api/v1/users/', json=payload)
+        self.assertEqual(resp.status_code, 400)
+
+    def test_email_lowercased_on_assignment(self):
+        from app.services import facade
+        user = facade.create_user({
+            "first_name": "Carol",
+            "last_name": "White",
+            "email": "carol@example.com",
+            "password": "secret123"
+        })
+        # e.g. the admin update path, which sets the attribute directly
+        user.email = " Carol.New@Example.COM "
+        db.session.commit()
+        self.assertEqual(user.email, "carol.new@example.com")
+        self.assertIs(facade.get_user_by_email("Carol.New@example.com"), user)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,371 @@
+"""Tests for the single-file API in run_simple.py."""
+
+import os
+import sys
+import tempfile
+import unittest
+import uuid
+from unittest import mock
+
+# run_simple binds its database at import time: point it at a scratch file first
+_TMP_DIR = tempfile.TemporaryDirectory()
+os.environ['HBNB_DB_PATH'] = os.path.join(_TMP_DIR.name, 'test.db')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import run_simple as rs  # noqa: E402
+
+rs.init_db()
+
+
+class TestUUIDBinary(unittest.TestCase):
+    """Tests for the UUIDBinary type and the text id migration."""
+
+    def setUp(self):
+        self.client = rs.app.test_client()
+        resp = self.client.post('/api/v1/auth/login', json={
+            "email": "demo@example.com",
+            "password": "DemoPass123"
+        })
+        self.assertEqual(resp.status_code, 200)
+        self.headers = {'Authorization': f"Bearer {resp.json['access_token']}"}
+
+    def test_bind_valid_uuid(self):
+        value = str(uuid.uuid4())
+        self.assertEqual(rs.UUIDBinary().process_bind_param(value, None), uuid.UUID(value).bytes)
+
+    def test_bind_malformed_and_non_string(self):
+        bind = rs.UUIDBinary().process_bind_param
+        self.assertEqual(bind('nope', None), b'nope')
+        self.assertEqual(bind(123, None), b'123')
+        self.assertIsNone(bind(None, None))
+
+    def test_result_legacy_text_passthrough(self):
+        value = str(uuid.uuid4())
+        self.assertEqual(rs.UUIDBinary().process_result_value(value, None), value)
+
+    def test_malformed_ids_return_404(self):
+        self.assertEqual(self.client.get('/api/v1/places/nope').status_code, 404)
+        resp = self.client.post('/api/v1/reviews', json={
+            "place_id": 123,
+            "text": "Great",
+            "rating": 5
+        }, headers=self.headers)
+        self.assertEqual(resp.status_code, 404)
+        self.assertEqual(resp.json, {"error": "Place not found"})
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'needs os.fork')
+    def test_gen_id_distinct_after_fork(self):
+        rs.gen_id()  # leave entropy in the parent's buffer
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.write(write_fd, rs.gen_id().encode())
+            os._exit(0)
+        os.waitpid(pid, 0)
+        child_id = os.read(read_fd, 64).decode()
+        os.close(read_fd)
+        os.close(write_fd)
+        self.assertNotEqual(child_id, rs.gen_id())
+
+    def test_migrate_text_ids(self):
+        place_id = str(uuid.uuid4())
+        with rs.app.app_context():
+            with rs.db.engine.begin() as conn:
+                conn.exec_driver_sql(
+                    "INSERT INTO place (id, title, price) VALUES (?, 'Legacy Loft', 50)", (place_id,))
+            rs.migrate_text_ids()
+            with rs.db.engine.connect() as conn:
+                kind = conn.exec_driver_sql(
+                    "SELECT typeof(id) FROM place WHERE title = 'Legacy Loft'").scalar()
+            self.assertEqual(kind, 'blob')
+            place = rs.db.session.get(rs.Place, place_id)
+            self.assertIsNotNone(place)
+            self.assertEqual(place.id, place_id)
+            rs.db.session.delete(place)
+            rs.db.session.commit()
+
+
+class TestSerialization(unittest.TestCase):
+    """Tests that list and detail responses carry the same fields."""
+
+    def test_place_list_and_detail_fields_match(self):
+        client = rs.app.test_client()
+        listed = client.get('/api/v1/places').json[0]
+        detail = client.get(f"/api/v1/places/{listed['id']}").json
+        self.assertEqual(listed, detail)
+
+    def test_user_list_and_detail_fields_match(self):
+        client = rs.app.test_client()
+        resp = client.post('/api/v1/auth/login', json={
+            "email": "admin@example.com",
+            "password": "AdminPass123"
+        })
+        headers = {'Authorization': f"Bearer {resp.json['access_token']}"}
+        listed = client.get('/api/v1/users', headers=headers).json[0]
+        detail = client.get(f"/api/v1/users/{listed['id']}").json
+        self.assertEqual(listed, detail)
+
+
+class TestCreateReview(unittest.TestCase):
+    """Tests for the POST /api/v1/reviews response body."""
+
+    def test_response_uses_stored_ids(self):
+        client = rs.app.test_client()
+        resp = client.post('/api/v1/auth/login', json={
+            "email": "admin@example.com",
+            "password": "AdminPass123"
+        })
+        headers = {'Authorization': f"Bearer {resp.json['access_token']}"}
+        place_id = client.get('/api/v1/places').json[0]['id']
+        resp = client.post('/api/v1/reviews', json={
+            "place_id": place_id.upper(),
+            "text": "Spelled in uppercase",
+            "rating": 4
+        }, headers=headers)
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(resp.json['place_id'], place_id)
+        stored = [r for r in client.get(f'/api/v1/reviews/places/{place_id}').json
+                  if r['id'] == resp.json['id']]
+        self.assertEqual(stored, [resp.json])
+
+
+def admin_headers(client):
+    resp = client.post('/api/v1/auth/login', json={
+        "email": "admin@example.com",
+        "password": "AdminPass123"
+    })
+    return {'Authorization': f"Bearer {resp.json['access_token']}"}
+
+
+class TestPlaceStats(unittest.TestCase):
+    """Tests for GET /api/v1/places/stats."""
+
+    def test_review_counts(self):
+        client = rs.app.test_client()
+        headers = admin_headers(client)
+        reviewed = client.post('/api/v1/places', json={"title": "Stats Loft", "price": 80},
+                               headers=headers).json['id']
+        unreviewed = client.post('/api/v1/places', json={"title": "Stats Barn", "price": 60},
+                                 headers=headers).json['id']
+        resp = client.post('/api/v1/reviews', json={
+            "place_id": reviewed,
+            "text": "Counted once",
+            "rating": 5
+        }, headers=headers)
+        self.assertEqual(resp.status_code, 201)
+
+        resp = client.get('/api/v1/places/stats')
+        self.assertEqual(resp.status_code, 200)
+        counts = {place['id']: place['review_count'] for place in resp.json}
+        self.assertEqual(counts[reviewed], 1)
+        self.assertEqual(counts[unreviewed], 0)
+        for place_id, count in counts.items():
+            self.assertEqual(count, len(client.get(f'/api/v1/reviews/places/{place_id}').json))
+
+        # the static route does not shadow /places/<place_id>, nor the other way round
+        self.assertEqual(client.get(f'/api/v1/places/{reviewed}').json['title'], 'Stats Loft')
+        self.assertNotIn('review_count', client.get(f'/api/v1/places/{reviewed}').json)
+
+
+class TestPlacesETag(unittest.TestCase):
+    """Tests for conditional GETs on the place endpoints."""
+
+    def setUp(self):
+        self.client = rs.app.test_client()
+        self.headers = admin_headers(self.client)
+
+    def assert_tag_changes(self, write):
+        resp = self.client.get('/api/v1/places')
+        etag = resp.headers['ETag']
+        self.assertTrue(etag.startswith('W/'))
+        cached = self.client.get('/api/v1/places', headers={'If-None-Match': etag})
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.headers['ETag'], etag)
+        self.assertEqual(cached.data, b'')
+
+        write()
+
+        resp = self.client.get('/api/v1/places', headers={'If-None-Match': etag})
+        self.assertEqual(resp.status_code, 200)
+        self.assertNotEqual(resp.headers['ETag'], etag)
+
+    def create_place(self):
+        resp = self.client.post('/api/v1/places', json={"title": "ETag Hut", "price": 40},
+                                headers=self.headers)
+        self.assertEqual(resp.status_code, 201)
+        return resp.json['id']
+
+    def test_get_place_not_modified(self):
+        place_id = self.create_place()
+        resp = self.client.get(f'/api/v1/places/{place_id}')
+        cached = self.client.get(f'/api/v1/places/{place_id}',
+                                 headers={'If-None-Match': resp.headers['ETag']})
+        self.assertEqual(cached.status_code, 304)
+
+    def test_create_place_changes_tag(self):
+        self.assert_tag_changes(self.create_place)
+
+    def test_update_place_changes_tag(self):
+        place_id = self.create_place()
+        self.assert_tag_changes(lambda: self.client.put(
+            f'/api/v1/places/{place_id}', json={"price": 45}, headers=self.headers))
+
+    def test_delete_place_changes_tag(self):
+        place_id = self.create_place()
+        self.assert_tag_changes(lambda: self.client.delete(
+            f'/api/v1/places/{place_id}', headers=self.headers))
+
+    def test_delete_user_changes_tag(self):
+        resp = self.client.post('/api/v1/users', json={
+            "first_name": "Temp",
+            "last_name": "Owner",
+            "email": f"temp_{uuid.uuid4().hex[:8]}@example.com",
+            "password": "TempPass123"
+        })
+        self.assertEqual(resp.status_code, 201)
+        user_id = resp.json['user']['id']
+        self.assert_tag_changes(lambda: self.client.delete(
+            f'/api/v1/users/{user_id}', headers=self.headers))
+
+
+class TestReviewDedup(unittest.TestCase):
+    """Tests for the unique review index on an existing database."""
+
+    def test_init_db_removes_duplicates_and_keeps_conflict(self):
+        client = rs.app.test_client()
+        resp = client.post('/api/v1/auth/login', json={
+            "email": "demo@example.com",
+            "password": "DemoPass123"
+        })
+        headers = {'Authorization': f"Bearer {resp.json['access_token']}"}
+        with rs.app.app_context():
+            user_id = rs.db.session.scalar(rs.db.select(rs.User.id).filter_by(email='demo@example.com'))
+            place_id = rs.db.session.scalar(rs.db.select(rs.Place.id).limit(1))
+            # a database from before the unique index: two identical reviews
+            with rs.db.engine.begin() as conn:
+                conn.exec_driver_sql('DROP INDEX uq_review_dedup')
+                conn.exec_driver_sql('CREATE INDEX ix_review_dup ON review (user_id, place_id, rating)')
+                for _ in range(2):
+                    conn.exec_driver_sql(
+                        "INSERT INTO review (id, user_id, place_id, text, rating) VALUES (?, ?, ?, 'Dup', 3)",
+                        (uuid.uuid4().bytes, uuid.UUID(user_id).bytes, uuid.UUID(place_id).bytes))
+        rs.init_db()
+        with rs.app.app_context():
+            with rs.db.engine.connect() as conn:
+                count = conn.exec_driver_sql("SELECT COUNT(*) FROM review WHERE text = 'Dup'").scalar()
+                indexes = {name for (name,) in conn.exec_driver_sql(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'review'")}
+        self.assertEqual(count, 1)
+        self.assertIn('uq_review_dedup', indexes)
+        self.assertNotIn('ix_review_dup', indexes)
+        resp = client.post('/api/v1/reviews', json={
+            "place_id": place_id,
+            "text": "Dup",
+            "rating": 3
+        }, headers=headers)
+        self.assertEqual(resp.status_code, 409)
+
+
+class TestLoginDummyHash(unittest.TestCase):
+    """Tests for the dummy hash used for unknown emails."""
+
+    def test_dummy_hash_follows_stored_hashes(self):
+        with rs.app.app_context():
+            rs.refresh_legacy_hashes()
+            self.assertFalse(rs.dummy_hash().startswith('scrypt:'))
+            legacy = rs.User(first_name='Old', last_name='Hash', email='legacy@example.com',
+                             password=rs.generate_password_hash('OldPass123'))
+            rs.db.session.add(legacy)
+            rs.db.session.commit()
+            rs.refresh_legacy_hashes()
+            self.assertTrue(rs.dummy_hash().startswith('scrypt:'))
+
+        # logging in upgrades the last legacy hash and switches back to the argon2 dummy
+        resp = rs.app.test_client().post('/api/v1/auth/login', json={
+            "email": "legacy@example.com",
+            "password": "OldPass123"
+        })
+        self.assertEqual(resp.status_code, 200)
+        self.assertFalse(rs.dummy_hash().startswith('scrypt:'))
+
+    def test_unknown_email_runs_kdf_on_every_try(self):
+        client = rs.app.test_client()
+        attempts = [
+            ("ghost@example.com", "10.0.1.1"),
+            ("other-ghost@example.com", "10.0.1.1"),
+            ("demo@example.com", "10.0.1.2"),
+            ("demo@example.com", "10.0.1.2"),
+        ]
+        with mock.patch.object(rs, 'check_password', wraps=rs.check_password) as kdf:
+            for email, addr in attempts:
+                resp = client.post('/api/v1/auth/login', json={
+                    "email": email,
+                    "password": "SamePassword1"
+                }, environ_base={'REMOTE_ADDR': addr})
+                self.assertEqual(resp.status_code, 401)
+        # one full KDF run per attempt: neither the second unknown email nor the
+        # repeated wrong password is answered from the verify cache
+        self.assertEqual(kdf.call_count, len(attempts))
+
+
+class TestVerifyCache(unittest.TestCase):
+    """Tests for the verify_password() result cache."""
+
+    def test_cache_hits_expiry_and_wrong_password(self):
+        pw_hash = rs.hash_password('RightPass1')
+        start = rs.time.monotonic()
+        with mock.patch.object(rs, 'check_password', wraps=rs.check_password) as kdf, \
+                mock.patch('run_simple.time') as clock:
+            clock.monotonic.return_value = start
+            self.assertTrue(rs.verify_password(pw_hash, 'RightPass1'))
+            self.assertTrue(rs.verify_password(pw_hash, 'RightPass1'))
+            self.assertEqual(kdf.call_count, 1)
+
+            # a cached success for the right password says nothing about another one
+            self.assertFalse(rs.verify_password(pw_hash, 'WrongPass1'))
+            self.assertEqual(kdf.call_count, 2)
+
+            clock.monotonic.return_value = start + rs.VERIFY_CACHE_TTL + 1
+            self.assertTrue(rs.verify_password(pw_hash, 'RightPass1'))
+            self.assertEqual(kdf.call_count, 3)
+
+
+class TestLoginRateLimit(unittest.TestCase):
+    """Tests for the login attempt limiter."""
+
+    def _login(self, password, addr):
+        return rs.app.test_client().post('/api/v1/auth/login', json={
+            "email": "admin@example.com",
+            "password": password
+        }, environ_base={'REMOTE_ADDR': addr})
+
+    def test_lockout_is_per_client(self):
+        for _ in range(rs.LOGIN_MAX_FAILURES):
+            self.assertEqual(self._login('bad', '10.0.0.1').status_code, 401)
+        self.assertEqual(self._login('AdminPass123', '10.0.0.1').status_code, 429)
+        # the account owner, from another address, is not locked out
+        self.assertEqual(self._login('AdminPass123', '10.0.0.2').status_code, 200)
+
+    def test_full_table_keeps_live_counters_and_fails_closed(self):
+        key = ('victim@example.com', '10.0.0.3')
+        saved = dict(rs._login_failures)
+        try:
+            rs._login_failures.clear()
+            for _ in range(rs.LOGIN_MAX_FAILURES):
+                rs.record_login_failure(key)
+            for i in range(rs.LOGIN_FAILURES_SIZE):
+                rs.record_login_failure((f'junk{i}@example.com', '10.0.0.4'))
+            self.assertTrue(rs.login_locked(key))
+            self.assertLessEqual(len(rs._login_failures), rs.LOGIN_FAILURES_SIZE)
+            # a client without a counter cannot get one: it must not get unlimited tries
+            new_key = ('demo@example.com', '10.0.0.5')
+            for _ in range(rs.LOGIN_MAX_FAILURES):
+                rs.record_login_failure(new_key)
+            self.assertTrue(rs.login_locked(new_key))
+        finally:
+            rs._login_failures.clear()
+            rs._login_failures.update(saved)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,30 @@
-from app import create_app
+"""Serve the static frontend (index.html, scripts.js, images...) on port 8000."""
+import os
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+HOST = os.getenv('HOST', '127.0.0.1')
+PORT = int(os.getenv('PORT', '8000'))
+ACCESS_LOG = bool(os.getenv('ACCESS_LOG'))
+
+
+class FrontendServer(ThreadingHTTPServer):
+    """One thread per connection, with a deeper listen backlog than the stdlib default (5)."""
+    daemon_threads = True
+    request_queue_size = 2048
+
+
+class FrontendHandler(SimpleHTTPRequestHandler):
+    """Static file handler that only writes access lines when ACCESS_LOG is set (errors are still logged)."""
+
+    def log_request(self, code='-', size='-'):
+        if ACCESS_LOG:
+            super().log_request(code, size)
 
-app = create_app()
 
 if __name__ == '__main__':
-    app.run(debug=True)
\ No newline at end of file
+    handler = partial(FrontendHandler, directory=BASE_DIR)
+    with FrontendServer((HOST, PORT), handler) as server:
+        print(f'Serving frontend on http://{HOST}:{PORT}/index.html')
+        server.serve_forever()
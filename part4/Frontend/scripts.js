@@ -414,21 +414,20 @@ async function fetchOwnerDetails(token, ownerId) {
 }
 
 /**
- * Fetches all reviews and filters by place ID
+ * Fetches the reviews of a single place
  * @param {string} token - JWT authentication token
  * @param {string} placeId - Place identifier to filter reviews
  * @returns {Promise<Array>} Array of review objects for the place
  */
 async function fetchPlaceReviews(token, placeId) {
     try {
-        const response = await fetch(`http://localhost:5000/api/v1/reviews`, {
+        // Let the backend filter by place instead of downloading every review
+        const response = await fetch(`http://localhost:5000/api/v1/reviews/places/${encodeURIComponent(placeId)}`, {
             method: 'GET',
             headers: token ? { 'Authorization': `Bearer ${token}` } : {}
         });
         if (response.ok) {
-            const allReviews = await response.json();
-            // Filter reviews for this specific place
-            return allReviews.filter(review => review.place_id === placeId);
+            return await response.json();
         }
     } catch (error) {
         console.error('Error fetching reviews:', error);
@@ -436,13 +435,30 @@ async function fetchPlaceReviews(token, placeId) {
     return [];
 }
 
+// User names already requested on this page, keyed by user ID
+const userNameCache = new Map();
+
 /**
  * Retrieves user's full name for review attribution
+ * Each user is requested once per page; later calls reuse the cached lookup
+ * @param {string} token - JWT authentication token
+ * @param {string} userId - User identifier
+ * @returns {Promise<string>} User's full name or 'Unknown User'
+ */
+function fetchUserDetails(token, userId) {
+    if (!userNameCache.has(userId)) {
+        userNameCache.set(userId, fetchUserName(token, userId));
+    }
+    return userNameCache.get(userId);
+}
+
+/**
+ * Fetches user's full name from user API
  * @param {string} token - JWT authentication token
  * @param {string} userId - User identifier
  * @returns {Promise<string>} User's full name or 'Unknown User'
  */
-async function fetchUserDetails(token, userId) {
+async function fetchUserName(token, userId) {
     try {
         const response = await fetch(`http://localhost:5000/api/v1/users/${userId}`, {
             method: 'GET',